@@ -269,7 +269,8 @@ class AlembicExporter(base.BaseWidget, object):
 
         if not tp.Dcc.attribute_exists(node=attr_node, attribute_name='tag_info'):
             tp.Dcc.add_string_attribute(node=attr_node, attribute_name='tag_info', keyable=True)
-        tp.Dcc.set_string_attribute_value(node=attr_node, attribute_name='tag_info', attribute_value=str(tag_info))
+        tp.Dcc.set_string_attribute_value(
+            node=attr_node, attribute_name='tag_info', attribute_value=json.dumps(tag_info, separators=(',', ':')))
 
     def _get_tag_atributes_dict(self, tag_node):
         # We add attributes to the first node in the list
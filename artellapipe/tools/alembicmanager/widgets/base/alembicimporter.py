@@ -14,11 +14,15 @@ __email__ = "tpovedatd@gmail.com"
 
 import os
 import json
+import stat
+import threading
 import logging.config
 from functools import partial
+from collections import OrderedDict, defaultdict
 
-from Qt.QtCore import *
-from Qt.QtWidgets import *
+from Qt.QtCore import Qt, QObject, QThread, QThreadPool, QRunnable, QSize, Signal, Slot
+from Qt.QtWidgets import QWidget, QLabel, QLineEdit, QPushButton, QCheckBox, QRadioButton, QProgressBar
+from Qt.QtWidgets import QGridLayout, QHBoxLayout, QSizePolicy
 
 from tpPyUtils import decorators, python
 
@@ -31,12 +35,152 @@ import artellapipe.register
 from artellapipe.utils import resource
 from artellapipe.libs.alembic.core import alembic
 
-if tp.is_maya():
-    import tpMayaLib as maya
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 LOGGER = logging.getLogger()
 
+_maya = None
+_TAG_INFO_CACHE = OrderedDict()
+_TAG_INFO_CACHE_MAX_SIZE = 256
+_TAG_INFO_CACHE_LOCK = threading.Lock()
+_ICON_CACHE = dict()
+
+# Import threads are not parented to importer widgets, so closing the tool does not destroy running threads
+_IMPORT_THREADS = set()
+
+
+def _stat_or_none(path):
+    """
+    Returns stat result of the given path or None if the path cannot be accessed
+    :param path: str
+    :return: os.stat_result or None
+    """
+
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _load_tag_info(path, mtime, size):
+    """
+    Returns the tag info dictionary stored in the given Alembic info file
+    Parsed data is cached using file path, modification time and size as key, so modified files are parsed again
+    :param path: str
+    :param mtime: float
+    :param size: int
+    :return: dict
+    """
+
+    key = (path, mtime, size)
+    with _TAG_INFO_CACHE_LOCK:
+        if key in _TAG_INFO_CACHE:
+            tag_info = _TAG_INFO_CACHE.pop(key)
+            _TAG_INFO_CACHE[key] = tag_info
+            return tag_info
+
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            tag_info = orjson.loads(f.read())
+    else:
+        with open(path, 'r') as f:
+            tag_info = json.load(f)
+
+    with _TAG_INFO_CACHE_LOCK:
+        _TAG_INFO_CACHE[key] = tag_info
+        while len(_TAG_INFO_CACHE) > _TAG_INFO_CACHE_MAX_SIZE:
+            _TAG_INFO_CACHE.popitem(last=False)
+
+    return tag_info
+
+
+def _get_maya():
+    """
+    Returns tpMayaLib module, it is only imported the first time it is needed
+    :return: module
+    """
+
+    global _maya
+    if _maya is None:
+        import tpMayaLib as _maya
+
+    return _maya
+
+
+def _get_icon(name):
+    """
+    Returns icon with given name, icons are only loaded once per session
+    :param name: str
+    :return: QIcon
+    """
+
+    if name not in _ICON_CACHE:
+        _ICON_CACHE[name] = resource.ResourceManager().icon(name)
+
+    return _ICON_CACHE[name]
+
+
+class _ImportWorker(QObject, object):
+    """
+    Worker that loads Alembic tag info files outside of Qt main thread
+    DCC calls are not thread safe, so Alembic files are imported in Qt main thread once tag info is loaded
+    """
+
+    finished = Signal(list)
+    progress = Signal(int)
+
+    def __init__(self, importer, abc_files, as_reference=False):
+        super(_ImportWorker, self).__init__()
+
+        self._importer = importer
+        self.abc_files = abc_files
+        self.as_reference = as_reference
+
+    @Slot()
+    def run(self):
+        """
+        Loads the tag info files of the Alembic files
+        """
+
+        total = len(self.abc_files)
+        tag_infos = list()
+        self.progress.emit(0)
+        for i, abc_file in enumerate(self.abc_files):
+            try:
+                tag_info = self._importer._get_tag_info(abc_file)
+            except Exception as exc:
+                LOGGER.error('Something went wrong while loading Alembic Info of {}: {}'.format(abc_file, exc))
+                tag_info = dict()
+            tag_infos.append(tag_info)
+            self.progress.emit(int(50 * (i + 1) / total))
+
+        self.finished.emit(tag_infos)
+
+
+class _ListFolderRunnable(QRunnable, object):
+    """
+    Runnable that lists the contents of a folder, so OS folder cache is warm when a file dialog opens it
+    """
+
+    def __init__(self, folder):
+        super(_ListFolderRunnable, self).__init__()
+
+        self._folder = folder
+
+    def run(self):
+        """
+        Lists folder contents, errors are ignored because this is only an optimization
+        """
+
+        try:
+            os.listdir(self._folder)
+        except OSError:
+            pass
+
 
 class AlembicImporter(base.BaseWidget, object):
 
@@ -45,22 +189,27 @@ class AlembicImporter(base.BaseWidget, object):
     def __init__(self, project, parent=None):
 
         self._project = project
+        self._import_worker = None
+        self._shot_regex = None
+        self._shot_line = None
+        self._create_radio = None
+        self._add_radio = None
+        self._merge_radio = None
+        self._alembic_folder_warmed = False
         super(AlembicImporter, self).__init__(parent=parent)
 
     def ui(self):
         super(AlembicImporter, self).ui()
 
+        self.setUpdatesEnabled(False)
+
+        # Rows 1 (shot name) and 3 (import mode) are hidden and are only built when needed (see _build_advanced)
         buttons_layout = QGridLayout()
+        buttons_layout.setColumnStretch(1, 1)
         self.main_layout.addLayout(buttons_layout)
+        self._buttons_layout = buttons_layout
 
-        shot_name_lbl = QLabel('Shot Name: ')
-        self._shot_line = QLineEdit()
-        buttons_layout.addWidget(shot_name_lbl, 1, 0, 1, 1, Qt.AlignRight)
-        buttons_layout.addWidget(self._shot_line, 1, 1)
-        shot_name_lbl.setVisible(False)
-        self._shot_line.setVisible(False)
-
-        folder_icon = resource.ResourceManager().icon('folder')
+        folder_icon = _get_icon('folder')
         alembic_path_layout = QHBoxLayout()
         alembic_path_layout.setContentsMargins(2, 2, 2, 2)
         alembic_path_layout.setSpacing(2)
@@ -69,6 +218,7 @@ class AlembicImporter(base.BaseWidget, object):
         alembic_path_lbl = QLabel('Alembic File: ')
         self._alembic_path_line = QLineEdit()
         self._alembic_path_line.setReadOnly(True)
+        self._alembic_path_line.setContextMenuPolicy(Qt.CustomContextMenu)
         self._alembic_path_btn = QPushButton()
         self._alembic_path_btn.setIcon(folder_icon)
         self._alembic_path_btn.setIconSize(QSize(18, 18))
@@ -79,24 +229,6 @@ class AlembicImporter(base.BaseWidget, object):
         buttons_layout.addWidget(alembic_path_lbl, 2, 0, 1, 1, Qt.AlignRight)
         buttons_layout.addWidget(alembic_path_widget, 2, 1)
 
-        import_mode_layout = QHBoxLayout()
-        import_mode_layout.setContentsMargins(2, 2, 2, 2)
-        import_mode_layout.setSpacing(2)
-        import_mode_widget = QWidget()
-        import_mode_widget.setLayout(import_mode_layout)
-        import_mode_lbl = QLabel('Import mode: ')
-        self._create_radio = QRadioButton('Create')
-        self._add_radio = QRadioButton('Add')
-        self._merge_radio = QRadioButton('Merge')
-        self._create_radio.setChecked(True)
-        import_mode_layout.addWidget(self._create_radio)
-        import_mode_layout.addWidget(self._add_radio)
-        import_mode_layout.addWidget(self._merge_radio)
-        buttons_layout.addWidget(import_mode_lbl, 3, 0, 1, 1, Qt.AlignRight)
-        buttons_layout.addWidget(import_mode_widget, 3, 1)
-        import_mode_lbl.setVisible(False)
-        import_mode_widget.setVisible(False)
-
         self._auto_display_lbl = QLabel('Auto Display Smooth?: ')
         self._auto_smooth_display = QCheckBox()
         self._auto_smooth_display.setChecked(True)
@@ -122,21 +254,88 @@ class AlembicImporter(base.BaseWidget, object):
         buttons_layout.setSpacing(2)
         self.main_layout.addLayout(buttons_layout)
         self._import_btn = QPushButton('Import')
-        self._import_btn.setIcon(resource.ResourceManager().icon('import'))
+        self._import_btn.setIcon(_get_icon('import'))
         self._import_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         self._reference_btn = QPushButton('Reference')
-        self._reference_btn.setIcon(resource.ResourceManager().icon('reference'))
+        self._reference_btn.setIcon(_get_icon('reference'))
         self._reference_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self._import_progress = QProgressBar()
+        self._import_progress.setRange(0, 100)
         buttons_layout.addWidget(self._import_btn)
         buttons_layout.addWidget(self._reference_btn)
+        buttons_layout.addWidget(self._import_progress)
 
         if tp.is_houdini():
             self._reference_btn.setEnabled(False)
 
+        self._import_progress.setVisible(False)
+
+        self.setUpdatesEnabled(True)
+        self.update()
+
+    @property
+    def shot_line(self):
+        """
+        Returns shot name line edit
+        :return: QLineEdit
+        """
+
+        self._build_advanced()
+
+        return self._shot_line
+
+    def _build_advanced(self):
+        """
+        Internal function that builds hidden shot name and import mode widgets
+        Those widgets are not visible by default, so they are only created the first time they are needed
+        """
+
+        if self._shot_line is not None:
+            return
+
+        shot_name_lbl = QLabel('Shot Name: ')
+        self._shot_line = QLineEdit()
+        shot_name_lbl.setVisible(False)
+        self._shot_line.setVisible(False)
+        self._buttons_layout.addWidget(shot_name_lbl, 1, 0, 1, 1, Qt.AlignRight)
+        self._buttons_layout.addWidget(self._shot_line, 1, 1)
+
+        import_mode_layout = QHBoxLayout()
+        import_mode_layout.setContentsMargins(2, 2, 2, 2)
+        import_mode_layout.setSpacing(2)
+        import_mode_widget = QWidget()
+        import_mode_widget.setLayout(import_mode_layout)
+        import_mode_lbl = QLabel('Import mode: ')
+        self._create_radio = QRadioButton('Create')
+        self._add_radio = QRadioButton('Add')
+        self._merge_radio = QRadioButton('Merge')
+        self._create_radio.setChecked(True)
+        import_mode_layout.addWidget(self._create_radio)
+        import_mode_layout.addWidget(self._add_radio)
+        import_mode_layout.addWidget(self._merge_radio)
+        import_mode_lbl.setVisible(False)
+        import_mode_widget.setVisible(False)
+        self._buttons_layout.addWidget(import_mode_lbl, 3, 0, 1, 1, Qt.AlignRight)
+        self._buttons_layout.addWidget(import_mode_widget, 3, 1)
+
+    def showEvent(self, event):
+        """
+        Overrides base BaseWidget showEvent function
+        The first time the widget is shown, Alembic folder is listed in background to speed up file browsing
+        :param event: QShowEvent
+        """
+
+        super(AlembicImporter, self).showEvent(event)
+
+        if not self._alembic_folder_warmed:
+            self._alembic_folder_warmed = True
+            QThreadPool.globalInstance().start(_ListFolderRunnable(self._get_alembic_folder()))
+
     def setup_signals(self):
         self._alembic_path_btn.clicked.connect(self._on_browse_alembic)
+        self._alembic_path_line.customContextMenuRequested.connect(self._on_alembic_path_context_menu)
         self._import_btn.clicked.connect(self._on_import_alembic)
-        self._reference_btn.clicked.connect(partial(self._on_import_alembic, True))
+        self._reference_btn.clicked.connect(self._on_reference_alembic)
 
     @classmethod
     @decorators.abstractmethod
@@ -166,21 +365,19 @@ class AlembicImporter(base.BaseWidget, object):
             LOGGER.warning('Alembic file {} does not exits!'.format(alembic_path))
             return None
 
-        abc_name = os.path.basename(alembic_path).split('.')[0]
-        tag_json_file = os.path.join(
-            os.path.dirname(alembic_path), os.path.basename(alembic_path).replace('.abc', '_abc.info'))
-        if not os.path.isfile(tag_json_file):
+        abc_name, tag_json_file = AlembicImporter._abc_sidecar_paths(alembic_path)
+        st = _stat_or_none(tag_json_file)
+        if not st or not stat.S_ISREG(st.st_mode):
             LOGGER.warning('No Alembic Info file found!')
             return
 
-        with open(tag_json_file, 'r') as f:
-            tag_info = json.loads(f.read())
+        tag_info = _load_tag_info(tag_json_file, st.st_mtime, st.st_size)
         if not tag_info:
             LOGGER.warning('No Alembic Info loaded!')
             return
 
         root = tp.Dcc.create_empty_group(name=abc_name)
-        AlembicImporter._add_tag_info_data(project, tag_info, root)
+        AlembicImporter._add_tag_info_data(project, tag_info, root, known_new=True)
         sel = [root]
         sel = sel or None
 
@@ -192,46 +389,98 @@ class AlembicImporter(base.BaseWidget, object):
         if not new_nodes:
             LOGGER.warning('Error while reference Alembic file: {}'.format(alembic_path))
             return
-        for obj in new_nodes:
-            if not tp.Dcc.object_exists(obj):
-                continue
-            if not tp.Dcc.node_type(obj) == 'transform':
-                continue
-            obj_parent = tp.Dcc.node_parent(obj)
-            if obj_parent:
-                continue
-            tp.Dcc.set_parent(obj, sel[0])
+        AlembicImporter._parent_root_transforms(new_nodes, sel[0])
         tp.Dcc.select_object(sel[0])
 
         new_nodes.insert(0, sel[0])
 
         # After parenting referenced nodes, full path changes, here we update node paths
+        # Nodes that cannot be found anymore are the ones that were parented, so we prefix them with root path
         if tp.is_maya():
+            found_nodes = set(_get_maya().cmds.ls(new_nodes, long=True) or list())
+            found_nodes.update(_get_maya().cmds.ls(new_nodes) or list())
             new_paths = list()
             for n in new_nodes:
-                if tp.Dcc.object_exists(n):
+                if n in found_nodes:
                     new_paths.append(n)
                 else:
-                    if n.startswith('|'):
-                        new_paths.append('{}{}'.format(sel[0], n))
-                    else:
-                        new_paths.append('{}|{}'.format(sel[0], n))
+                    new_paths.append(('{}{}' if n.startswith('|') else '{}|{}').format(sel[0], n))
             return new_paths
 
         return new_nodes
 
     @staticmethod
-    def _add_tag_info_data(project, tag_info, attr_node):
+    def _parent_root_transforms(nodes, parent):
+        """
+        Internal function that parents the given nodes that are root transforms under the given parent
+        :param nodes: list(str)
+        :param parent: str
+        """
+
+        if tp.is_maya():
+            transforms = _get_maya().cmds.ls(nodes, exactType='transform', long=True) or list()
+            root_transforms = [xform for xform in transforms if xform.count('|') == 1]
+            if root_transforms:
+                _get_maya().cmds.parent(root_transforms, parent)
+            return
+
+        object_exists = tp.Dcc.object_exists
+        node_type = tp.Dcc.node_type
+        node_parent = tp.Dcc.node_parent
+        set_parent = tp.Dcc.set_parent
+        for obj in nodes:
+            if not object_exists(obj):
+                continue
+            if not node_type(obj) == 'transform':
+                continue
+            if node_parent(obj):
+                continue
+            set_parent(node=obj, parent=parent)
+
+    @staticmethod
+    def _abc_sidecar_paths(abc_file):
+        """
+        Internal function that returns Alembic name and the path of its tag info file
+        Alembic name is used as node name and namespace, so it stops at the first dot (shot.v001.abc > shot)
+        :param abc_file: str
+        :return: tuple(str, str)
+        """
+
+        abc_dir, abc_base = os.path.split(abc_file)
+        abc_name = abc_base.split('.')[0]
+        tag_json_file = os.path.join(abc_dir, os.path.splitext(abc_base)[0] + '_abc.info')
+
+        return abc_name, tag_json_file
+
+    @staticmethod
+    def _add_tag_info_data(project, tag_info, attr_node, known_new=False):
         """
         Internal function that updates the tag info of the Alembic node
         :param project: ArtellaProject
         :param tag_info: dict
         :param attr_node: str
+        :param known_new: bool, Whether attr_node has just been created and has no tag_info attribute yet
         """
 
+        tag_info_str = json.dumps(tag_info, separators=(',', ':'))
+        if known_new and tp.is_maya():
+            _get_maya().cmds.addAttr(attr_node, ln='tag_info', dt='string', keyable=True)
+            _get_maya().cmds.setAttr('{}.tag_info'.format(attr_node), tag_info_str, type='string')
+            return
+
         if not tp.Dcc.attribute_exists(node=attr_node, attribute_name='tag_info'):
             tp.Dcc.add_string_attribute(node=attr_node, attribute_name='tag_info', keyable=True)
-        tp.Dcc.set_string_attribute_value(node=attr_node, attribute_name='tag_info', attribute_value=str(tag_info))
+        tp.Dcc.set_string_attribute_value(node=attr_node, attribute_name='tag_info', attribute_value=tag_info_str)
+
+    @classmethod
+    def _tag_info_cache_clear(cls):
+        """
+        Internal function that clears cached Alembic tag info
+        Useful when Alembic info files are modified outside of the tool
+        """
+
+        with _TAG_INFO_CACHE_LOCK:
+            _TAG_INFO_CACHE.clear()
 
     def refresh(self):
         """
@@ -240,6 +489,46 @@ class AlembicImporter(base.BaseWidget, object):
 
         self._refresh_shot_name()
 
+    def import_alembics(self, files, as_reference=False):
+        """
+        Imports/references given Alembic files in a single background thread
+        Tag info is added to the imported nodes once all files are imported
+        :param files: list(str)
+        :param as_reference: bool
+        :return: bool, True if the import process was started; False otherwise
+        """
+
+        if self._import_worker is not None:
+            LOGGER.warning('Alembic import already in progress!')
+            return False
+
+        abc_files = list()
+        for abc_file in python.force_list(files):
+            if not abc_file or not os.path.isfile(abc_file):
+                LOGGER.warning('Alembic file {} does not exits!'.format(abc_file))
+                continue
+            abc_files.append(abc_file)
+        if not abc_files:
+            LOGGER.warning('No Alembic files to import!')
+            return False
+
+        import_thread = QThread()
+        self._import_worker = _ImportWorker(importer=self, abc_files=abc_files, as_reference=as_reference)
+        self._import_worker.moveToThread(import_thread)
+        import_thread.started.connect(self._import_worker.run)
+        self._import_worker.progress.connect(self._import_progress.setValue)
+        self._import_worker.finished.connect(self._on_tag_info_loaded)
+        self._import_worker.finished.connect(import_thread.quit)
+        import_thread.finished.connect(self._import_worker.deleteLater)
+        import_thread.finished.connect(import_thread.deleteLater)
+        import_thread.finished.connect(partial(_IMPORT_THREADS.discard, import_thread))
+        _IMPORT_THREADS.add(import_thread)
+
+        self._set_import_enabled(False)
+        import_thread.start()
+
+        return True
+
     def _refresh_shot_name(self):
         """
         Internal function that updates the shot name QLineEdit text
@@ -250,22 +539,33 @@ class AlembicImporter(base.BaseWidget, object):
         if current_scene:
             current_scene = os.path.basename(current_scene)
 
-        shot_regex = self._project.get_shot_name_regex()
-        m = shot_regex.match(current_scene)
+        if self._shot_regex is None:
+            self._shot_regex = self._project.get_shot_name_regex()
+        m = self._shot_regex.match(current_scene)
         if m:
             shot_name = m.group(1)
 
-        self._shot_line.setText(shot_name)
+        self.shot_line.setText(shot_name)
 
-    def _on_browse_alembic(self):
+    def _get_alembic_folder(self):
         """
-        Internal callback function that is called when Browse Alembic File button is clicked
+        Internal function that returns the folder where Alembic files should be browsed from
+        :return: str
         """
 
-        shot_name = self._shot_line.text()
+        shot_name = self._shot_line.text() if self._shot_line is not None else ''
         abc_folder = os.path.normpath(os.path.join(
             self._project.get_path(), shot_name)) if shot_name != 'unresolved' else self._project.get_path()
 
+        return abc_folder
+
+    def _on_browse_alembic(self):
+        """
+        Internal callback function that is called when Browse Alembic File button is clicked
+        """
+
+        abc_folder = self._get_alembic_folder()
+
         pattern = 'Alembic Files (*.abc)'
         if tp.is_houdini():
             pattern = '*.abc'
@@ -274,6 +574,19 @@ class AlembicImporter(base.BaseWidget, object):
         if abc_file:
             self._alembic_path_line.setText(abc_file)
 
+    def _on_alembic_path_context_menu(self, pos):
+        """
+        Internal callback function that is called when the user right clicks on Alembic path line
+        :param pos: QPoint
+        """
+
+        menu = self._alembic_path_line.createStandardContextMenu()
+        menu.addSeparator()
+        refresh_action = menu.addAction('Refresh')
+        refresh_action.triggered.connect(self._tag_info_cache_clear)
+        menu.exec_(self._alembic_path_line.mapToGlobal(pos))
+        menu.deleteLater()
+
     def _on_import_alembic(self, as_reference=False):
         """
         Internal callback function that is called when Import/Reference Alembic button is clicked
@@ -281,51 +594,166 @@ class AlembicImporter(base.BaseWidget, object):
         """
 
         abc_file = self._alembic_path_line.text()
-        if not abc_file or not os.path.isfile(abc_file):
+        if not self.import_alembics([abc_file], as_reference=as_reference):
             tp.Dcc.confirm_dialog(
                 title='Error', message='No Alembic File is selected or file is not currently available in disk')
+
+    @Slot()
+    def _on_reference_alembic(self):
+        """
+        Internal callback function that is called when Reference Alembic button is clicked
+        """
+
+        return self._on_import_alembic(as_reference=True)
+
+    def _on_tag_info_loaded(self, tag_infos):
+        """
+        Internal callback function that is called when import thread finishes loading Alembic tag info files
+        Alembic files are imported here because DCC calls are not thread safe and must be executed in Qt main thread
+        :param tag_infos: list(dict)
+        :return: list
+        """
+
+        worker = self._import_worker
+        self._import_worker = None
+
+        results = list()
+        failed_files = list()
+        total = len(worker.abc_files)
+
+        # The whole batch (imports and tag info) is stored in a single undo chunk
+        if tp.is_maya():
+            _get_maya().cmds.undoInfo(chunkName='abc_import', openChunk=True)
+        try:
+            for i, (abc_file, tag_info) in enumerate(zip(worker.abc_files, tag_infos)):
+                try:
+                    nodes, tag_info = self._do_import(abc_file, tag_info=tag_info, as_reference=worker.as_reference)
+                except Exception as exc:
+                    LOGGER.error('Something went wrong while importing Alembic file {}: {}'.format(abc_file, exc))
+                    nodes = None
+                if nodes:
+                    results.append((nodes, tag_info))
+                else:
+                    LOGGER.warning('Alembic file {} import returned no nodes!'.format(abc_file))
+                    failed_files.append(abc_file)
+                self._import_progress.setValue(50 + int(50 * (i + 1) / total))
+                self._import_progress.repaint()
+
+            return self._on_import_finished(results, as_reference=worker.as_reference, failed_files=failed_files)
+        finally:
+            if tp.is_maya():
+                _get_maya().cmds.undoInfo(chunkName='abc_import', closeChunk=True)
+
+    def _on_import_finished(self, results, as_reference=False, failed_files=None):
+        """
+        Internal function that is called when all Alembic files are imported
+        :param results: list(tuple(list, dict)), imported nodes and tag info of each successfully imported Alembic file
+        :param as_reference: bool
+        :param failed_files: list(str), Alembic files that could not be imported or whose import returned no nodes
+        :return: list, all imported nodes
+        """
+
+        self._set_import_enabled(True)
+
+        if failed_files:
+            tp.Dcc.confirm_dialog(
+                title='Error',
+                message='Error while importing Alembic files:\n\n{}'.format('\n'.join(failed_files)))
+
+        if not results:
             return None
 
-        abc_name = os.path.basename(abc_file).split('.')[0]
-        tag_json_file = os.path.join(os.path.dirname(abc_file), os.path.basename(abc_file).replace('.abc', '_abc.info'))
-        valid_tag_info = True
-        if os.path.isfile(tag_json_file):
-            with open(tag_json_file, 'r') as f:
-                tag_info = json.loads(f.read())
-            if not tag_info:
-                LOGGER.warning('No Alembic Info loaded!')
-                valid_tag_info = False
+        reference_nodes = list()
+        for nodes, tag_info in results:
+            self._add_alembic_tag_info(nodes, tag_info)
+            reference_nodes.extend(nodes)
+
+        if len(results) > 1:
+            if as_reference:
+                self.showOk.emit('{} Alembic files referenced successfully!'.format(len(results)))
+            else:
+                self.showOk.emit('{} Alembic files imported successfully!'.format(len(results)))
         else:
-            LOGGER.warning('No Alembic Info file found!')
-            valid_tag_info = False
+            if as_reference:
+                self.showOk.emit('Alembic file referenced successfully!')
+            else:
+                self.showOk.emit('Alembic file imported successfully!')
+
+        return reference_nodes
+
+    def _set_import_enabled(self, flag):
+        """
+        Internal function that enables/disables import buttons and shows/hides import progress bar
+        :param flag: bool
+        """
+
+        self._import_btn.setEnabled(flag)
+        self._reference_btn.setEnabled(flag and not tp.is_houdini())
+        self._import_progress.setVisible(not flag)
+        if not flag:
+            self._import_progress.setValue(0)
+
+    @classmethod
+    def _get_tag_info(cls, abc_file):
+        """
+        Internal function that returns the tag info of the given Alembic file
+        :param abc_file: str
+        :return: dict, empty if the Alembic file has no tag info
+        """
+
+        tag_json_file = cls._abc_sidecar_paths(abc_file)[1]
+        st = _stat_or_none(tag_json_file)
+        if not st or not stat.S_ISREG(st.st_mode):
+            return dict()
+
+        return _load_tag_info(tag_json_file, st.st_mtime, st.st_size) or dict()
+
+    def _do_import(self, abc_file, tag_info=None, as_reference=False):
+        """
+        Internal function that imports/references given Alembic file without any UI interaction
+        Tag info is not added to the imported nodes (see _add_alembic_tag_info)
+        :param abc_file: str
+        :param tag_info: dict, already loaded Alembic tag info. If None, it is loaded from disk
+        :param as_reference: bool
+        :return: tuple(list, dict), imported nodes and Alembic tag info
+        """
+
+        if tag_info is None:
+            tag_info = self._get_tag_info(abc_file)
+        if not tag_info:
+            LOGGER.warning('No Alembic Info found for {}!'.format(abc_file))
 
         if as_reference:
+            abc_name = self._abc_sidecar_paths(abc_file)[0]
             reference_nodes = self._reference_alembic(alembic_file=abc_file, namespace=abc_name)
         else:
-            reference_nodes = self._import_alembic(
-                alembic_file=abc_file, valid_tag_info=valid_tag_info)
-        reference_nodes = python.force_list(reference_nodes)
+            reference_nodes = self._import_alembic(alembic_file=abc_file, valid_tag_info=bool(tag_info))
+
+        return python.force_list(reference_nodes), tag_info
+
+    def _add_alembic_tag_info(self, reference_nodes, tag_info):
+        """
+        Internal function that adds given Alembic tag info to the nodes it belongs to
+        If no node matches any tag info key, the whole tag info is added to the first node
+        :param reference_nodes: list
+        :param tag_info: dict
+        """
+
+        if not reference_nodes or not tag_info:
+            return
 
         added_tag = False
-        for key in tag_info.keys():
-            if reference_nodes:
-                for obj in reference_nodes:
-                    short_obj = tp.Dcc.node_short_name(obj)
-                    if key == short_obj:
-                        self._add_tag_info_data(self._project, tag_info[key], obj)
-                        added_tag = True
+        short_names = defaultdict(list)
+        for obj in reference_nodes:
+            short_names[tp.Dcc.node_short_name(obj)].append(obj)
+        for key, info in tag_info.items():
+            for obj in short_names.get(key, list()):
+                self._add_tag_info_data(self._project, info, obj)
+                added_tag = True
 
         if not added_tag:
             self._add_tag_info_data(self._project, tag_info, reference_nodes[0])
 
-        if reference_nodes:
-            if as_reference:
-                self.showOk.emit('Alembic file referenced successfully!')
-            else:
-                self.showOk.emit('Alembic file imported successfully!')
-
-        return reference_nodes
-
     @classmethod
     def _create_alembic_group(cls, group_name):
         """
@@ -355,7 +783,7 @@ class AlembicImporter(base.BaseWidget, object):
 
         return res
 
-    def _reference_alembic(self, alembic_file, namespace, parent):
+    def _reference_alembic(self, alembic_file, namespace, parent=None):
         """
         Internal function that references given alembic file
         :param alembic_file: str
@@ -367,15 +795,8 @@ class AlembicImporter(base.BaseWidget, object):
         if not all_nodes:
             LOGGER.warning('Error while reference Alembic file: {}'.format(alembic_file))
             return
-        for obj in all_nodes:
-            if not tp.Dcc.object_exists(obj):
-                continue
-            if not tp.Dcc.node_type(obj) == 'transform':
-                continue
-            obj_parent = tp.Dcc.node_parent(obj)
-            if obj_parent:
-                continue
-            tp.Dcc.set_parent(node=obj, parent=parent)
+        if parent:
+            self._parent_root_transforms(all_nodes, parent)
 
         return all_nodes
 
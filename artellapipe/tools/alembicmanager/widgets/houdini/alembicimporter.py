@@ -13,6 +13,7 @@ __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
 import os
+import stat
 import json
 import logging
 
@@ -53,12 +54,11 @@ class HoudiniAlembicImporter(alembicimporter.AlembicImporter, object):
             LOGGER.warning('Alembic file {} does not exits!'.format(alembic_path))
             return None
 
-        tag_json_file = os.path.join(
-            os.path.dirname(alembic_path), os.path.basename(alembic_path).replace('.abc', '_abc.info'))
+        tag_json_file = cls._abc_sidecar_paths(alembic_path)[1]
         valid_tag_info = True
-        if os.path.isfile(tag_json_file):
-            with open(tag_json_file, 'r') as f:
-                tag_info = json.loads(f.read())
+        st = alembicimporter._stat_or_none(tag_json_file)
+        if st and stat.S_ISREG(st.st_mode):
+            tag_info = alembicimporter._load_tag_info(tag_json_file, st.st_mtime, st.st_size)
             if not tag_info:
                 LOGGER.warning('No Alembic Info loaded!')
                 valid_tag_info = False
@@ -97,13 +97,14 @@ class HoudiniAlembicImporter(alembicimporter.AlembicImporter, object):
         return
 
     @staticmethod
-    def _add_tag_info_data(project, tag_info, attr_node):
+    def _add_tag_info_data(project, tag_info, attr_node, known_new=False):
         """
         Overrides base AlembicImporter _add_tag_info_data function
         Internal function that updates the tag info of the Alembic node
         :param project: dict
         :param tag_info: dict
         :param attr_node: str
+        :param known_new: bool
         """
 
         parm_group = attr_node.parmTemplateGroup()
@@ -111,7 +112,7 @@ class HoudiniAlembicImporter(alembicimporter.AlembicImporter, object):
         parm_folder.addParmTemplate(hou.StringParmTemplate('tag_info', 'Tag Info', 1))
         parm_group.append(parm_folder)
         attr_node.setParmTemplateGroup(parm_group)
-        attr_node.parm('tag_info').set(str(tag_info))
+        attr_node.parm('tag_info').set(json.dumps(tag_info, separators=(',', ':')))
 
     def _create_alembic_group(self, group_name):
         """
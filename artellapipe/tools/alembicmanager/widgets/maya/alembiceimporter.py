@@ -13,7 +13,7 @@ __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
 import os
-import json
+import stat
 import logging
 
 import tpDccLib as tp
@@ -47,12 +47,11 @@ class MayaAlembicImporter(alembicimporter.AlembicImporter, object):
             LOGGER.warning('Alembic file {} does not exits!'.format(alembic_path))
             return None
 
-        tag_json_file = os.path.join(
-            os.path.dirname(alembic_path), os.path.basename(alembic_path).replace('.abc', '_abc.info'))
+        tag_json_file = cls._abc_sidecar_paths(alembic_path)[1]
         valid_tag_info = True
-        if os.path.isfile(tag_json_file):
-            with open(tag_json_file, 'r') as f:
-                tag_info = json.loads(f.read())
+        st = alembicimporter._stat_or_none(tag_json_file)
+        if st and stat.S_ISREG(st.st_mode):
+            tag_info = alembicimporter._load_tag_info(tag_json_file, st.st_mtime, st.st_size)
             if not tag_info:
                 LOGGER.warning('No Alembic Info loaded!')
                 valid_tag_info = False
@@ -74,7 +73,7 @@ class MayaAlembicImporter(alembicimporter.AlembicImporter, object):
                 return
 
         if parent and valid_tag_info:
-            cls._add_tag_info_data(project=project, tag_info=tag_info, attr_node=parent)
+            cls._add_tag_info_data(project=project, tag_info=tag_info, attr_node=parent, known_new=True)
 
         track_nodes = maya_scene.TrackNodes()
         track_nodes.load()
@@ -106,14 +105,18 @@ class MayaAlembicImporter(alembicimporter.AlembicImporter, object):
 
         return res
 
-    def _on_import_alembic(self, as_reference=False):
+    def _on_import_finished(self, results, as_reference=False, failed_files=None):
         """
-        Overrides base AlembicImporter _on_import_alembic function
-        Internal callback function that is called when Import/Reference Alembic button is clicked
+        Overrides base AlembicImporter _on_import_finished function
+        Internal function that is called when all Alembic files are imported
+        :param results: list(tuple(list, dict)), imported nodes and tag info of each imported Alembic file
         :param as_reference: bool
+        :param failed_files: list(str), Alembic files that could not be imported
+        :return: list, all imported nodes
         """
 
-        reference_nodes = super(MayaAlembicImporter, self)._on_import_alembic(as_reference=as_reference)
+        reference_nodes = super(MayaAlembicImporter, self)._on_import_finished(
+            results, as_reference=as_reference, failed_files=failed_files)
 
         if self._auto_smooth_display.isChecked():
             if reference_nodes and type(reference_nodes) in [list, tuple]:
@@ -0,0 +1,191 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-alembicmanager Alembic importer
+"""
+
+import os
+import json
+
+import pytest
+
+from artellapipe.tools.alembicmanager.widgets.base import alembicimporter
+
+
+@pytest.fixture(autouse=True)
+def clear_tag_info_cache():
+    alembicimporter.AlembicImporter._tag_info_cache_clear()
+    yield
+    alembicimporter.AlembicImporter._tag_info_cache_clear()
+
+
+def _write_tag_info(path, tag_info):
+    with open(path, 'w') as f:
+        json.dump(tag_info, f)
+    st = os.stat(path)
+    return st.st_mtime, st.st_size
+
+
+def test_abc_sidecar_paths():
+    abc_file = os.path.join('shots', 'shot.abc')
+    abc_name, tag_json_file = alembicimporter.AlembicImporter._abc_sidecar_paths(abc_file)
+    assert abc_name == 'shot'
+    assert tag_json_file == os.path.join('shots', 'shot_abc.info')
+
+
+def test_abc_sidecar_paths_multiple_dots():
+    abc_file = os.path.join('shots', 'shot.v001.abc')
+    abc_name, tag_json_file = alembicimporter.AlembicImporter._abc_sidecar_paths(abc_file)
+    assert abc_name == 'shot'
+    assert tag_json_file == os.path.join('shots', 'shot.v001_abc.info')
+
+
+def test_load_tag_info_is_cached(tmpdir):
+    tag_json_file = str(tmpdir.join('shot_abc.info'))
+    mtime, size = _write_tag_info(tag_json_file, {'geo': {'name': 'geo'}})
+
+    tag_info = alembicimporter._load_tag_info(tag_json_file, mtime, size)
+    assert tag_info == {'geo': {'name': 'geo'}}
+    assert alembicimporter._load_tag_info(tag_json_file, mtime, size) is tag_info
+
+
+def test_load_tag_info_invalidates_modified_files(tmpdir):
+    tag_json_file = str(tmpdir.join('shot_abc.info'))
+    mtime, size = _write_tag_info(tag_json_file, {'geo': {'name': 'geo'}})
+    assert alembicimporter._load_tag_info(tag_json_file, mtime, size) == {'geo': {'name': 'geo'}}
+
+    mtime, size = _write_tag_info(tag_json_file, {'geo': {'name': 'geo'}, 'hair': {'name': 'hair'}})
+    assert alembicimporter._load_tag_info(tag_json_file, mtime, size) == {
+        'geo': {'name': 'geo'}, 'hair': {'name': 'hair'}}
+
+
+def test_load_tag_info_evicts_least_recently_used(tmpdir, monkeypatch):
+    monkeypatch.setattr(alembicimporter, '_TAG_INFO_CACHE_MAX_SIZE', 2)
+
+    keys = list()
+    for name in ['a', 'b', 'c']:
+        tag_json_file = str(tmpdir.join('{}_abc.info'.format(name)))
+        mtime, size = _write_tag_info(tag_json_file, {name: {}})
+        keys.append((tag_json_file, mtime, size))
+
+    alembicimporter._load_tag_info(*keys[0])
+    alembicimporter._load_tag_info(*keys[1])
+    alembicimporter._load_tag_info(*keys[0])
+    alembicimporter._load_tag_info(*keys[2])
+
+    assert list(alembicimporter._TAG_INFO_CACHE.keys()) == [keys[0], keys[2]]
+
+
+def test_tag_info_cache_clear(tmpdir):
+    tag_json_file = str(tmpdir.join('shot_abc.info'))
+    mtime, size = _write_tag_info(tag_json_file, {'geo': {}})
+    alembicimporter._load_tag_info(tag_json_file, mtime, size)
+    assert alembicimporter._TAG_INFO_CACHE
+
+    alembicimporter.AlembicImporter._tag_info_cache_clear()
+    assert not alembicimporter._TAG_INFO_CACHE
+
+
+class _FakeImporter(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class _FakeProgress(object):
+    def setValue(self, value):
+        pass
+
+    def repaint(self):
+        pass
+
+
+def _call(method, fake_self, *args, **kwargs):
+    return getattr(method, '__func__', method)(fake_self, *args, **kwargs)
+
+
+def test_on_tag_info_loaded_continues_after_failed_imports(monkeypatch):
+    monkeypatch.setattr(alembicimporter.tp, 'is_maya', lambda: False, raising=False)
+
+    def _do_import(abc_file, tag_info=None, as_reference=False):
+        if abc_file == 'broken.abc':
+            raise RuntimeError('broken')
+        if abc_file == 'empty.abc':
+            return list(), tag_info
+        return [abc_file.replace('.abc', '_grp')], tag_info
+
+    finished = dict()
+
+    def _on_import_finished(results, as_reference=False, failed_files=None):
+        finished.update(results=results, failed_files=failed_files)
+        return results
+
+    worker = _FakeImporter(abc_files=['broken.abc', 'empty.abc', 'shot.abc'], as_reference=False)
+    fake_self = _FakeImporter(
+        _import_worker=worker, _import_progress=_FakeProgress(),
+        _do_import=_do_import, _on_import_finished=_on_import_finished)
+
+    _call(alembicimporter.AlembicImporter._on_tag_info_loaded, fake_self, [{}, {}, {'shot': {}}])
+
+    assert fake_self._import_worker is None
+    assert finished['results'] == [(['shot_grp'], {'shot': {}})]
+    assert finished['failed_files'] == ['broken.abc', 'empty.abc']
+
+
+class _FakeDcc(object):
+    @staticmethod
+    def node_short_name(node):
+        return node.split('|')[-1]
+
+
+def _tag_calls(monkeypatch, reference_nodes, tag_info):
+    monkeypatch.setattr(alembicimporter.tp, 'Dcc', _FakeDcc, raising=False)
+    calls = list()
+    fake_self = _FakeImporter(
+        _project=None, _add_tag_info_data=lambda project, info, node: calls.append((info, node)))
+    _call(alembicimporter.AlembicImporter._add_alembic_tag_info, fake_self, reference_nodes, tag_info)
+    return calls
+
+
+def test_add_alembic_tag_info_tags_nodes_sharing_short_name(monkeypatch):
+    calls = _tag_calls(monkeypatch, ['|a|geo', '|b|geo', '|a'], {'geo': {'name': 'geo'}})
+    assert calls == [({'name': 'geo'}, '|a|geo'), ({'name': 'geo'}, '|b|geo')]
+
+
+def test_add_alembic_tag_info_falls_back_to_first_node(monkeypatch):
+    tag_info = {'hair': {'name': 'hair'}}
+    calls = _tag_calls(monkeypatch, ['|a|geo', '|b|geo'], tag_info)
+    assert calls == [(tag_info, '|a|geo')]
+
+
+def test_reference_alembic_keeps_node_order_and_names(tmpdir, monkeypatch):
+    abc_file = str(tmpdir.join('shot.abc'))
+    open(abc_file, 'w').close()
+    _write_tag_info(str(tmpdir.join('shot_abc.info')), {'geo': {}})
+
+    class _RefDcc(object):
+        @staticmethod
+        def create_empty_group(name):
+            return name
+
+        @staticmethod
+        def select_object(node):
+            pass
+
+    class _FakeCmds(object):
+        @staticmethod
+        def ls(nodes, long=False):
+            # 'shot:geo' was parented under the root group, so it cannot be found anymore
+            existing = {'shot': '|shot', 'shot:mesh': '|shot:mesh'}
+            return [existing[n] if long else n for n in nodes if n in existing]
+
+    monkeypatch.setattr(alembicimporter.tp, 'Dcc', _RefDcc, raising=False)
+    monkeypatch.setattr(alembicimporter.tp, 'is_maya', lambda: True, raising=False)
+    monkeypatch.setattr(alembicimporter, '_get_maya', lambda: _FakeImporter(cmds=_FakeCmds))
+    monkeypatch.setattr(
+        alembicimporter.alembic, 'reference_alembic', lambda **kwargs: ['shot:mesh', 'shot:geo'], raising=False)
+    monkeypatch.setattr(alembicimporter.AlembicImporter, '_add_tag_info_data', staticmethod(lambda *args, **kw: None))
+    monkeypatch.setattr(alembicimporter.AlembicImporter, '_parent_root_transforms', staticmethod(lambda *args: None))
+
+    new_nodes = alembicimporter.AlembicImporter.reference_alembic(None, abc_file)
+    assert new_nodes == ['shot', 'shot:mesh', 'shot|shot:geo']